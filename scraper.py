@@ -9,18 +9,54 @@ Author: Personal Use Tool
 License: Educational/Personal Use Only
 """
 
-import requests
+import aiohttp
+import asyncio
 from bs4 import BeautifulSoup
 import csv
+import gzip
+import hashlib
+import json
+import operator
+import os
+import re
 import argparse
+import contextlib
+import functools
 import time
-import random
 import sys
 from datetime import datetime
 from pathlib import Path
-from urllib.parse import urlparse
 import logging
 
+# Prefer the C-backed lxml parser; fall back to the stdlib parser if missing
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    HTML_PARSER = 'lxml'
+except ImportError:
+    etree = lxml_html = None
+    HTML_PARSER = 'html.parser'
+
+# selectolax (lexbor engine) handles the pure CSS-selector lookups when installed
+try:
+    from selectolax.lexbor import LexborHTMLParser, SelectolaxError
+except ImportError:
+    LexborHTMLParser = SelectolaxError = None
+
+# Prefer orjson for the embedded listing JSON; the stdlib decoder also accepts bytes
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Progress bar is optional; without tqdm, progress is reported through the log
+try:
+    from tqdm import tqdm
+    from tqdm.contrib.logging import logging_redirect_tqdm
+except ImportError:
+    tqdm = logging_redirect_tqdm = None
+
 
 # Configure logging
 logging.basicConfig(
@@ -40,41 +76,527 @@ USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTM
 # Request timeout in seconds
 REQUEST_TIMEOUT = 30
 
-# Rate limiting: random delay between requests (in seconds)
-MIN_DELAY = 5
-MAX_DELAY = 8
+# URL prefixes accepted as Zillow listings
+ZILLOW_URL_PREFIXES = ('https://www.zillow.com/', 'https://zillow.com/')
+
+# Requested once per batch to open a keep-alive connection before the listings
+ZILLOW_HOME_URL = 'https://www.zillow.com/'
+
+# Rate limiting: long-run average requests per second and allowed burst size
+DEFAULT_RATE = 0.15
+DEFAULT_BURST = 2
+
+# Maximum number of listings fetched at the same time
+MAX_CONCURRENT_REQUESTS = 4
+
+# Connection pool sizing: total open connections, and open connections to a single host
+MAX_CONNECTIONS = 16
+MAX_CONNECTIONS_PER_HOST = 2
+
+# Seconds an idle keep-alive connection (and a resolved DNS entry) is kept for reuse
+KEEPALIVE_TIMEOUT = 75
+DNS_CACHE_TTL = 300
+
+# Seconds a cached page (and, separately, a cached failure) stays valid
+CACHE_TTL = 24 * 60 * 60
+ERROR_CACHE_TTL = 15 * 60
+
+# gzip level for cache entries; the default of 9 is far slower for little gain on HTML
+CACHE_COMPRESSLEVEL = 5
+
+# Per-URL progress reporting styles
+PROGRESS_MODES = ('none', 'bar', 'log')
 
 # Maximum recommended URLs per execution
 MAX_URLS_WARNING = 20
 
+# Output CSV columns
+CSV_FIELDNAMES = ('url', 'address', 'lot_size', 'price', 'price_per_sqft',
+                  'days_on_market', 'scrape_timestamp', 'error')
+
+# Output CSV buffer size, and how many rows may sit in the buffer before a flush
+CSV_BUFFER_SIZE = 64 * 1024
+CSV_FLUSH_EVERY = 5
+
+# Builds a CSV row tuple from a result dict in column order
+csv_row = operator.itemgetter(*CSV_FIELDNAMES)
+
+
+def _lower(expr):
+    """Wrap an XPath expression so it compares case-insensitively."""
+    return f"translate({expr}, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+
+
+# CSS selectors used against the selectolax tree, tried in order
+_CSS_ADDRESS = (
+    'h1.ds-address-container',
+    'h1[data-testid="bdp-address"]',
+    'h1',
+)
+_CSS_PRICE = (
+    'span[data-testid="price"]',
+    'span[class*="price" i]',
+    'div[class*="price" i]',
+)
+_CSS_LOT_TESTID = 'span[data-testid*="lot" i]'
+_CSS_PPSF_TESTID = 'span[data-testid*="price-per-sqft" i]'
+
+# Lower-case labels that introduce a price per square foot value
+PPSF_LABELS = ('$/sqft', 'per sqft', 'price/sqft')
+
+
+# XPath queries used against the lxml tree, compiled once at import.
+# Tuples are tried in order, mirroring the BeautifulSoup selector priority.
+if etree is not None:
+    _XP_ADDRESS = (
+        etree.XPath("//h1[contains(concat(' ', normalize-space(@class), ' '), ' ds-address-container ')]"),
+        etree.XPath("//h1[@data-testid='bdp-address']"),
+        etree.XPath("(//h1)[1]"),
+    )
+    _XP_PRICE = (
+        etree.XPath("(//span[@data-testid='price'])[1]"),
+        etree.XPath(f"(//span[contains({_lower('@class')}, 'price')])[1]"),
+        etree.XPath(f"(//div[contains({_lower('@class')}, 'price')])[1]"),
+    )
+    _XP_LOT = (
+        etree.XPath(f"//span[contains({_lower('text()')}, 'lot size')]/following::span[1]"),
+        etree.XPath(f"//span[contains({_lower('@data-testid')}, 'lot')]"),
+    )
+    _XP_PPSF = (
+        etree.XPath(
+            f"//span[contains({_lower('text()')}, '$/sqft') or contains({_lower('text()')}, 'per sqft') "
+            f"or contains({_lower('text()')}, 'price/sqft')]/parent::*"
+            "/following-sibling::*[contains(., '$')][1]"
+        ),
+        etree.XPath(
+            f"//span[contains({_lower('text()')}, '$/sqft') or contains({_lower('text()')}, 'per sqft') "
+            f"or contains({_lower('text()')}, 'price/sqft')]/parent::*"
+            "/preceding-sibling::*[1][contains(., '$')]"
+        ),
+        etree.XPath(f"//span[contains({_lower('@data-testid')}, 'price-per-sqft')]"),
+    )
+    _XP_DOM = etree.XPath(
+        f"//text()[contains({_lower('.')}, 'on zillow') or contains({_lower('.')}, 'days on market')]/parent::*"
+    )
+
+# Zillow's embedded Next.js payload, which carries the listing as structured JSON
+_RE_NEXT_DATA = re.compile(rb'<script[^>]*\bid="__NEXT_DATA__"[^>]*>(.*?)</script>', re.S)
+
+# Keyword-anchored patterns run over the raw HTML before falling back to BeautifulSoup
+_RE_LOT = re.compile(r'lot size(?:<[^>]*>|[^<]){0,80}?([\d.,]+\s*(?:sqft|sq ft|acres?))', re.I)
+_RE_DOM = re.compile(r'(\d[\d,]*)\s*days?\s*on\s*(?:Zillow|market)', re.I)
+_RE_PPSF = re.compile(r'\$\s*([\d,]+)\s*/\s*(?:sq ?ft|sqft)', re.I)
+_RE_PRICE = re.compile(r'\$\s?\d{1,3}(?:,\d{3})+(?:\.\d{2})?')
+
+# BeautifulSoup fallback selectors, built once rather than on every call
+_SOUP_ADDRESS = (
+    ('h1', {'class': 'ds-address-container'}),
+    ('h1', {'data-testid': 'bdp-address'}),
+    ('h1', {}),  # Fallback to first h1
+)
+_SOUP_PRICE = (
+    ('span', {'data-testid': 'price'}),
+    ('span', {'class': re.compile('price', re.I)}),
+    ('div', {'class': re.compile('price', re.I)}),
+)
+_SOUP_LOT_LABEL = re.compile('lot size', re.I)
+_SOUP_LOT_TESTID = re.compile('lot', re.I)
+_SOUP_PPSF_LABEL = re.compile(r'\$/sqft|per sqft|price/sqft', re.I)
+_SOUP_PPSF_TESTID = re.compile('price-per-sqft', re.I)
+_RE_DOM_LABEL = re.compile('on zillow|days on market', re.I)
+
+# Units that mark a lot size value
+LOT_SIZE_UNITS = ('sqft', 'sq ft', 'acres', 'acre')
+
+
+def _node_text(element):
+    """Return an lxml element's text the way BeautifulSoup's get_text(strip=True) does."""
+    return ''.join(part.strip() for part in element.itertext())
+
+
+def _is_element(node):
+    """Whether a selectolax node is an element rather than text or a comment."""
+    return not node.tag.startswith('-')
+
+
+def _css_texts(css_tree, selectors):
+    """Yield the non-empty text of each selector's first match, in selector order."""
+    for selector in selectors:
+        node = css_tree.css_first(selector)
+        if node is not None:
+            text = node.text(strip=True)
+            if text:
+                yield text
+
+
+def _css_following_spans(css_tree, label):
+    """Yield the first span after each span whose own text contains `label` (XPath following::span[1])."""
+    spans = css_tree.css('span')
+    for i, span in enumerate(spans):
+        if label in span.text(deep=False).lower():
+            # Spans nested inside the label come straight after it; skip past them
+            following = i + 1 + len(span.css('span'))
+            if following < len(spans):
+                yield spans[following]
+
+
+def _css_ppsf_candidates(css_tree):
+    """Yield elements next to a price/sqft label, in the same order as _XP_PPSF."""
+    parents = [span.parent for span in css_tree.css('span')
+               if any(label in span.text(deep=False).lower() for label in PPSF_LABELS)]
+
+    # First sibling after the label's container that mentions a dollar amount
+    for parent in parents:
+        node = parent.next
+        while node is not None:
+            if _is_element(node) and '$' in node.text():
+                yield node
+                break
+            node = node.next
+
+    # Otherwise the element right before the container
+    for parent in parents:
+        node = parent.prev
+        while node is not None and not _is_element(node):
+            node = node.prev
+        if node is not None and '$' in node.text():
+            yield node
+
+    yield from css_tree.css(_CSS_PPSF_TESTID)
+
+
+def _parse_days(full_text):
+    """Pull a day count out of text such as '12 days on Zillow'."""
+    words = full_text.split()
+    for i, word in enumerate(words):
+        if word.isdigit() or (word.replace(',', '').isdigit()):
+            # Check if next word is "day" or "days"
+            if i + 1 < len(words) and 'day' in words[i + 1].lower():
+                return f"{word} days"
+            # Or if it just has a number before "on Zillow"
+            elif 'zillow' in full_text.lower() or 'market' in full_text.lower():
+                return f"{word} days"
+    return None
+
+
+def _find_listing(next_data):
+    """Locate the listing's property dict inside the __NEXT_DATA__ payload."""
+    component_props = next_data['props']['pageProps']['componentProps']
+
+    # Listing pages keep the property inside a JSON-encoded client cache
+    cache = component_props.get('gdpClientCache')
+    if cache:
+        if isinstance(cache, (str, bytes)):
+            cache = json_loads(cache)
+        for entry in cache.values():
+            if isinstance(entry, dict) and isinstance(entry.get('property'), dict):
+                return entry['property']
+
+    return component_props.get('property') or {}
+
+
+def _format_number(value):
+    """Format a number with thousands separators, dropping a redundant '.0'."""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return f"{value:,}"
+
+
+def _extract_from_next_data(html_bytes):
+    """
+    Extract property fields from the page's embedded __NEXT_DATA__ JSON.
+
+    Returns:
+        dict: Whichever of address, lot_size, price, price_per_sqft and
+              days_on_market were found; empty if the payload is missing
+    """
+    match = _RE_NEXT_DATA.search(html_bytes)
+    if not match:
+        return {}
+
+    try:
+        listing = _find_listing(json_loads(match.group(1)))
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        logger.debug("Could not read __NEXT_DATA__: %s", e)
+        return {}
+
+    # Anything not shaped as expected is left for the HTML extractors
+    if not isinstance(listing, dict):
+        return {}
+
+    fields = {}
+
+    address = listing.get('address')
+    if isinstance(address, dict) and isinstance(address.get('streetAddress'), str):
+        def part(key):
+            value = address.get(key)
+            return value if isinstance(value, str) else None
+
+        parts = [part('streetAddress'), part('city'),
+                 ' '.join(filter(None, [part('state'), part('zipcode')]))]
+        fields['address'] = ', '.join(text for text in parts if text)
+
+    price = listing.get('price')
+    if isinstance(price, (int, float)):
+        fields['price'] = f"${price:,.0f}"
+
+    lot_value = listing.get('lotAreaValue')
+    lot_units = listing.get('lotAreaUnits')
+    if isinstance(lot_value, (int, float)) and lot_value > 0 and isinstance(lot_units, str):
+        units = 'sqft' if lot_units.lower() in ('square feet', 'sqft') else lot_units.lower()
+        fields['lot_size'] = f"{_format_number(lot_value)} {units}"
+    elif isinstance(listing.get('lotSize'), (int, float)):
+        fields['lot_size'] = f"{_format_number(listing['lotSize'])} sqft"
+
+    reso_facts = listing.get('resoFacts')
+    price_per_sqft = reso_facts.get('pricePerSquareFoot') if isinstance(reso_facts, dict) else None
+    if isinstance(price_per_sqft, (int, float)):
+        fields['price_per_sqft'] = f"${price_per_sqft:,.0f}"
+
+    days = listing.get('daysOnZillow')
+    if isinstance(days, int) and days >= 0:
+        fields['days_on_market'] = f"{days} days"
+
+    return fields
+
+
+@functools.lru_cache(maxsize=1)
+def _format_timestamp(epoch_seconds):
+    """Format a whole-second epoch time; scrapes within the same second share the result."""
+    return datetime.fromtimestamp(epoch_seconds).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def validate_url(url):
+    """Validate that URL is a Zillow domain."""
+    return url.startswith(ZILLOW_URL_PREFIXES)
+
+
+class ParsedPage:
+    """
+    A downloaded listing with lazily-built parse trees.
+
+    A single tree is built and shared by every extractor: selectolax when it
+    is installed, otherwise lxml. BeautifulSoup is only built if that tree
+    and the regex fallbacks come up empty.
+    """
+
+    def __init__(self, content, encoding=None):
+        self.content = content
+        self.encoding = encoding
+        self._text = None
+        self._css_tree = None
+        self._tree = None
+        self._soup = None
+
+    @property
+    def text(self):
+        """Page HTML decoded once to a string, for regex-based extraction."""
+        if self._text is None:
+            try:
+                self._text = self.content.decode(self.encoding or 'utf-8', errors='replace')
+            except LookupError:
+                # Unknown charset in the Content-Type header
+                self._text = self.content.decode('utf-8', errors='replace')
+        return self._text
+
+    @property
+    def css_tree(self):
+        """selectolax tree, or None if selectolax is unavailable or parsing fails."""
+        if self._css_tree is None and LexborHTMLParser is not None:
+            try:
+                self._css_tree = LexborHTMLParser(self.content)
+            except (SelectolaxError, ValueError) as e:
+                logger.debug("selectolax could not parse page: %s", e)
+                self._css_tree = False
+        return self._css_tree if self._css_tree is not False else None
+
+    @property
+    def primary_tree(self):
+        """
+        The (css_tree, tree) pair to extract from; only one is ever built.
+
+        lxml is only parsed when selectolax is unavailable or fails.
+        """
+        css_tree = self.css_tree
+        return css_tree, (self.tree if css_tree is None else None)
+
+    @property
+    def tree(self):
+        """lxml element tree, or None if lxml is unavailable or parsing fails."""
+        if self._tree is None and lxml_html is not None:
+            try:
+                self._tree = lxml_html.fromstring(self.content)
+            except (etree.ParserError, ValueError) as e:
+                logger.debug("lxml could not parse page: %s", e)
+                self._tree = False
+        return self._tree if self._tree is not False else None
+
+    @property
+    def soup(self):
+        """BeautifulSoup tree used as the fallback extraction path."""
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.content, HTML_PARSER)
+        return self._soup
+
+
+class TokenBucket:
+    """
+    Async token-bucket rate limiter.
+
+    Allows bursts of up to `capacity` requests while keeping the long-run
+    average at `refill_rate` requests per second.
+    """
+
+    def __init__(self, refill_rate, capacity):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+
+    async def acquire(self, n=1):
+        """Wait until `n` tokens are available, then consume them."""
+        async with self._lock:
+            self._refill()
+            if self.tokens < n:
+                await asyncio.sleep((n - self.tokens) / self.refill_rate)
+                self._refill()
+            self.tokens -= n
+
+
+class PageCache:
+    """
+    On-disk cache of fetched listing pages, keyed by a SHA-1 of the URL.
+
+    Pages are stored gzip-compressed; failed fetches are remembered in a
+    separate file with a shorter TTL so re-runs don't hammer broken URLs.
+    """
+
+    def __init__(self, cache_dir, ttl=CACHE_TTL, error_ttl=ERROR_CACHE_TTL):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.error_ttl = error_ttl
+
+    def _path(self, url, suffix):
+        return self.cache_dir / (hashlib.sha1(url.encode()).hexdigest() + suffix)
+
+    @staticmethod
+    def _is_fresh(path, ttl):
+        try:
+            return path.stat().st_mtime > time.time() - ttl
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def _write(path, data):
+        # Write to a temporary file first so an interrupted run never leaves a partial entry
+        tmp_path = path.with_name(path.name + '.tmp')
+        try:
+            with gzip.open(tmp_path, 'wb', compresslevel=CACHE_COMPRESSLEVEL) as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # Caching is best-effort; a full or read-only disk shouldn't fail the scrape
+            logger.warning("Could not write cache entry %s: %s", path, e)
+
+    def has(self, url):
+        """Whether the URL has a fresh cached page or cached failure."""
+        return (self._is_fresh(self._path(url, '.html.gz'), self.ttl)
+                or self._is_fresh(self._path(url, '.err.gz'), self.error_ttl))
+
+    def get(self, url):
+        """Return the cached page body, or None if missing or expired."""
+        path = self._path(url, '.html.gz')
+        if not self._is_fresh(path, self.ttl):
+            return None
+        try:
+            with gzip.open(path, 'rb') as f:
+                return f.read()
+        except (OSError, EOFError) as e:
+            logger.debug("Ignoring unreadable cache entry %s: %s", path, e)
+            return None
+
+    def put(self, url, content):
+        """Store a fetched page body and clear any cached failure."""
+        self._write(self._path(url, '.html.gz'), content)
+        try:
+            self._path(url, '.err.gz').unlink()
+        except FileNotFoundError:
+            pass
+
+    def get_error(self, url):
+        """Return a recently cached error message for the URL, if any."""
+        path = self._path(url, '.err.gz')
+        if not self._is_fresh(path, self.error_ttl):
+            return None
+        try:
+            with gzip.open(path, 'rb') as f:
+                return f.read().decode('utf-8')
+        except (OSError, EOFError, UnicodeDecodeError):
+            return None
+
+    def put_error(self, url, message):
+        """Remember a failed fetch for the error TTL."""
+        self._write(self._path(url, '.err.gz'), message.encode('utf-8'))
+
 
 class ZillowScraper:
     """Scraper for extracting property data from Zillow listings."""
 
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+    def __init__(self, cache_dir=None):
+        self.cache = PageCache(cache_dir) if cache_dir else None
+        self.headers = {
             'User-Agent': USER_AGENT,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
+            # No Accept-Encoding: aiohttp advertises only the encodings it can decode
             'DNT': '1',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
-        })
+        }
 
-    def validate_url(self, url):
-        """Validate that URL is a Zillow domain."""
-        try:
-            parsed = urlparse(url)
-            return 'zillow.com' in parsed.netloc.lower()
-        except:
-            return False
+    def create_session(self):
+        """Create an aiohttp session that shares one connection pool for a batch."""
+        # Keep connections warm between listings so later requests skip the TCP/TLS handshake
+        connector = aiohttp.TCPConnector(
+            limit=MAX_CONNECTIONS,
+            limit_per_host=MAX_CONNECTIONS_PER_HOST,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=DNS_CACHE_TTL,
+        )
+        return aiohttp.ClientSession(headers=self.headers, connector=connector)
+
+    async def warm_up(self, session, limiter=None):
+        """
+        Open a connection to Zillow ahead of the first listing request.
 
-    def extract_property_data(self, url):
+        Pays the DNS, TCP and TLS setup cost up front so the first listing
+        fetch reuses a pooled keep-alive connection. Failures are ignored.
+        """
+        try:
+            if limiter is not None:
+                await limiter.acquire()
+            timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+            async with session.head(ZILLOW_HOME_URL, timeout=timeout, allow_redirects=False):
+                pass
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.debug("Connection warm-up failed: %s", e)
+
+    async def extract_property_data(self, session, url, limiter=None):
         """
         Extract property data from a Zillow listing URL.
 
+        Args:
+            session: aiohttp session used to fetch the listing
+            url: Zillow listing URL
+            limiter: Optional TokenBucket awaited before a network request
+
         Returns:
             dict: Property data with keys: url, address, lot_size, price,
                   price_per_sqft, days_on_market, scrape_timestamp, error
@@ -86,65 +608,120 @@ class ZillowScraper:
             'price': 'N/A',
             'price_per_sqft': 'N/A',
             'days_on_market': 'N/A',
-            'scrape_timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'scrape_timestamp': 'N/A',
             'error': None
         }
 
-        if not self.validate_url(url):
+        if not validate_url(url):
             result['error'] = 'Invalid Zillow URL'
-            logger.warning(f"Invalid URL: {url}")
+            logger.warning("Invalid URL: %s", url)
             return result
 
-        try:
-            # Fetch the page
-            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
-
-            # Parse HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Extract address
-            result['address'] = self._extract_address(soup)
-
-            # Extract lot size
-            result['lot_size'] = self._extract_lot_size(soup)
+        # Cache reads/writes and parsing run in the executor so they never stall other fetches
+        loop = asyncio.get_running_loop()
 
-            # Extract price
-            result['price'] = self._extract_price(soup)
+        content = encoding = None
+        if self.cache:
+            cached_error = await loop.run_in_executor(None, self.cache.get_error, url)
+            if cached_error:
+                result['error'] = cached_error
+                result['scrape_timestamp'] = _format_timestamp(int(time.time()))
+                logger.info("Using cached failure for URL: %s", url)
+                return result
+            content = await loop.run_in_executor(None, self.cache.get, url)
 
-            # Extract price per sqft
-            result['price_per_sqft'] = self._extract_price_per_sqft(soup)
+        try:
+            if content is None:
+                # Rate limiting: only requests that actually hit the network use a token
+                if limiter is not None:
+                    await limiter.acquire()
+
+                # Stamp the row with the fetch time, not the time spent queued for a token
+                logger.debug("Processing: %s", url)
+                result['scrape_timestamp'] = _format_timestamp(int(time.time()))
+
+                # Fetch the page
+                timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+                async with session.get(url, timeout=timeout) as response:
+                    response.raise_for_status()
+                    # Keep the body as bytes; the parsers read the charset themselves
+                    content = await response.read()
+                    encoding = response.charset
+
+                if self.cache:
+                    await loop.run_in_executor(None, self.cache.put, url, content)
+            else:
+                logger.debug("Using cached page for URL: %s", url)
+                result['scrape_timestamp'] = _format_timestamp(int(time.time()))
 
-            # Extract days on market
-            result['days_on_market'] = self._extract_days_on_market(soup)
+            # Parse off the event loop so other fetches keep making progress
+            result.update(await loop.run_in_executor(None, self.parse_property_data, content, encoding))
 
-            logger.info(f"Successfully scraped: {result['address']}")
+            logger.debug("Successfully scraped: %s", result['address'])
 
-        except requests.exceptions.Timeout:
+        except asyncio.TimeoutError:
             result['error'] = 'Request timeout'
-            logger.error(f"Timeout for URL: {url}")
-        except requests.exceptions.HTTPError as e:
-            result['error'] = f'HTTP {e.response.status_code}'
-            logger.error(f"HTTP error for URL: {url} - {e}")
-        except requests.exceptions.RequestException as e:
+            logger.error("Timeout for URL: %s", url)
+        except aiohttp.ClientResponseError as e:
+            result['error'] = f'HTTP {e.status}'
+            logger.error("HTTP error for URL: %s - %s", url, e)
+        except aiohttp.ClientError as e:
             result['error'] = f'Request failed: {str(e)}'
-            logger.error(f"Request failed for URL: {url} - {e}")
+            logger.error("Request failed for URL: %s - %s", url, e)
         except Exception as e:
             result['error'] = f'Parsing error: {str(e)}'
-            logger.error(f"Parsing error for URL: {url} - {e}")
+            logger.error("Parsing error for URL: %s - %s", url, e)
+            return result
+
+        # Remember network failures so an immediate re-run doesn't retry them
+        if result['error'] and self.cache:
+            await loop.run_in_executor(None, self.cache.put_error, url, result['error'])
 
         return result
 
-    def _extract_address(self, soup):
+    def parse_property_data(self, content, encoding=None):
+        """
+        Parse a downloaded listing page.
+
+        Args:
+            content: Raw response body (bytes)
+            encoding: Charset from the Content-Type header, if any
+
+        Returns:
+            dict: Extracted fields keyed by address, lot_size, price,
+                  price_per_sqft and days_on_market
+        """
+        # Structured JSON first; HTML is only parsed for fields it lacks
+        data = _extract_from_next_data(content)
+
+        # Parse HTML lazily (pass raw bytes so the parser honours the page charset)
+        page = ParsedPage(content, encoding)
+
+        return {
+            'address': data.get('address') or self._extract_address(page),
+            'lot_size': data.get('lot_size') or self._extract_lot_size(page),
+            'price': data.get('price') or self._extract_price(page),
+            'price_per_sqft': data.get('price_per_sqft') or self._extract_price_per_sqft(page),
+            'days_on_market': data.get('days_on_market') or self._extract_days_on_market(page),
+        }
+
+    def _extract_address(self, page):
         """Extract property address from page."""
-        # Try multiple selectors for address
-        selectors = [
-            ('h1', {'class': 'ds-address-container'}),
-            ('h1', {'data-testid': 'bdp-address'}),
-            ('h1', {}),  # Fallback to first h1
-        ]
-
-        for tag, attrs in selectors:
+        css_tree, tree = page.primary_tree
+        if css_tree is not None:
+            for address_text in _css_texts(css_tree, _CSS_ADDRESS):
+                return address_text
+
+        if tree is not None:
+            for xpath in _XP_ADDRESS:
+                for element in xpath(tree):
+                    address_text = _node_text(element)
+                    if address_text:
+                        return address_text
+
+        # Fall back to BeautifulSoup selectors
+        soup = page.soup
+        for tag, attrs in _SOUP_ADDRESS:
             element = soup.find(tag, attrs)
             if element:
                 address_text = element.get_text(strip=True)
@@ -153,131 +730,189 @@ class ZillowScraper:
 
         return 'N/A'
 
-    def _extract_lot_size(self, soup):
+    def _extract_lot_size(self, page):
         """Extract lot size from page."""
         # Look for lot size in various places
         try:
+            css_tree, tree = page.primary_tree
+            if css_tree is not None:
+                for node in _css_following_spans(css_tree, 'lot size'):
+                    lot_text = node.text(strip=True)
+                    if lot_text and 'lot size' not in lot_text.lower():
+                        return lot_text
+                for node in css_tree.css(_CSS_LOT_TESTID):
+                    text = node.text(strip=True)
+                    if any(unit in text.lower() for unit in LOT_SIZE_UNITS):
+                        return text
+
+            if tree is not None:
+                label_xpath, testid_xpath = _XP_LOT
+                for element in label_xpath(tree):
+                    lot_text = _node_text(element)
+                    if lot_text and 'lot size' not in lot_text.lower():
+                        return lot_text
+                for element in testid_xpath(tree):
+                    text = _node_text(element)
+                    if any(unit in text.lower() for unit in LOT_SIZE_UNITS):
+                        return text
+
+            match = _RE_LOT.search(page.text)
+            if match:
+                return match.group(1)
+
+            soup = page.soup
+
             # Method 1: Look in facts and features section
-            lot_keywords = ['Lot size', 'Lot Size', 'lot size']
-            for keyword in lot_keywords:
-                spans = soup.find_all('span', string=lambda text: text and keyword in text)
-                for span in spans:
-                    # Look for value in nearby elements
-                    parent = span.find_parent()
-                    if parent:
-                        next_span = parent.find_next('span')
-                        if next_span:
-                            lot_text = next_span.get_text(strip=True)
-                            if lot_text and lot_text != keyword:
-                                return lot_text
+            for span in soup.find_all('span', string=_SOUP_LOT_LABEL):
+                # Look for value in nearby elements
+                parent = span.find_parent()
+                if parent:
+                    next_span = parent.find_next('span')
+                    if next_span:
+                        lot_text = next_span.get_text(strip=True)
+                        if lot_text and lot_text.lower() != 'lot size':
+                            return lot_text
 
             # Method 2: Look in data attributes or structured data
             # This might need adjustment based on actual page structure
-            facts = soup.find_all('span', {'data-testid': lambda x: x and 'lot' in x.lower() if x else False})
+            facts = soup.find_all('span', {'data-testid': _SOUP_LOT_TESTID})
             for fact in facts:
                 text = fact.get_text(strip=True)
-                if any(unit in text.lower() for unit in ['sqft', 'sq ft', 'acres', 'acre']):
+                if any(unit in text.lower() for unit in LOT_SIZE_UNITS):
                     return text
 
         except Exception as e:
-            logger.debug(f"Error extracting lot size: {e}")
+            logger.debug("Error extracting lot size: %s", e)
 
         return 'N/A'
 
-    def _extract_price(self, soup):
+    def _extract_price(self, page):
         """Extract listing price from page."""
         try:
-            # Look for price in various selectors
-            selectors = [
-                ('span', {'data-testid': 'price'}),
-                ('span', {'class': lambda x: x and 'price' in x.lower() if x else False}),
-                ('div', {'class': lambda x: x and 'price' in x.lower() if x else False}),
-            ]
+            css_tree, tree = page.primary_tree
+            if css_tree is not None:
+                for price_text in _css_texts(css_tree, _CSS_PRICE):
+                    if '$' in price_text:
+                        return price_text
 
-            for tag, attrs in selectors:
+            if tree is not None:
+                for xpath in _XP_PRICE:
+                    for element in xpath(tree):
+                        price_text = _node_text(element)
+                        if price_text and '$' in price_text:
+                            return price_text
+
+            soup = page.soup
+
+            # Look for price in various selectors
+            for tag, attrs in _SOUP_PRICE:
                 element = soup.find(tag, attrs)
                 if element:
                     price_text = element.get_text(strip=True)
                     if price_text and '$' in price_text:
                         return price_text
 
-            # Try to find any element with dollar sign and large number
-            all_text = soup.find_all(string=lambda text: text and '$' in text and any(c.isdigit() for c in text))
-            for text in all_text:
-                text = text.strip()
-                # Look for price patterns like $XXX,XXX
-                if text.startswith('$') and ',' in text:
-                    return text.split()[0]  # Take first word to avoid descriptions
+            # Look for the first price pattern like $XXX,XXX anywhere in the page
+            match = _RE_PRICE.search(page.text)
+            if match:
+                return match.group(0)
 
         except Exception as e:
-            logger.debug(f"Error extracting price: {e}")
+            logger.debug("Error extracting price: %s", e)
 
         return 'N/A'
 
-    def _extract_price_per_sqft(self, soup):
+    def _extract_price_per_sqft(self, page):
         """Extract price per square foot from page."""
         try:
+            css_tree, tree = page.primary_tree
+            if css_tree is not None:
+                for node in _css_ppsf_candidates(css_tree):
+                    text = node.text(strip=True)
+                    if text:
+                        return text
+
+            if tree is not None:
+                for xpath in _XP_PPSF:
+                    for element in xpath(tree):
+                        text = _node_text(element)
+                        if text:
+                            return text
+
+            match = _RE_PPSF.search(page.text)
+            if match:
+                return f"${match.group(1)}"
+
+            soup = page.soup
+
             # Look for price per sqft patterns
-            patterns = ['$/sqft', 'per sqft', 'Price/sqft']
-
-            for pattern in patterns:
-                spans = soup.find_all('span', string=lambda text: text and pattern.lower() in text.lower() if text else False)
-                for span in spans:
-                    parent = span.find_parent()
-                    if parent:
-                        # Look for adjacent value
-                        for sibling in parent.find_next_siblings():
-                            text = sibling.get_text(strip=True)
-                            if text and '$' in text:
-                                return text
-                        # Or previous sibling
-                        prev = parent.find_previous_sibling()
-                        if prev:
-                            text = prev.get_text(strip=True)
-                            if text and '$' in text:
-                                return text
+            for span in soup.find_all('span', string=_SOUP_PPSF_LABEL):
+                parent = span.find_parent()
+                if parent:
+                    # Look for adjacent value
+                    for sibling in parent.find_next_siblings():
+                        text = sibling.get_text(strip=True)
+                        if text and '$' in text:
+                            return text
+                    # Or previous sibling
+                    prev = parent.find_previous_sibling()
+                    if prev:
+                        text = prev.get_text(strip=True)
+                        if text and '$' in text:
+                            return text
 
             # Alternative: look for specific data attributes
-            price_sqft_elem = soup.find('span', {'data-testid': lambda x: x and 'price-per-sqft' in x.lower() if x else False})
+            price_sqft_elem = soup.find('span', {'data-testid': _SOUP_PPSF_TESTID})
             if price_sqft_elem:
                 return price_sqft_elem.get_text(strip=True)
 
         except Exception as e:
-            logger.debug(f"Error extracting price per sqft: {e}")
+            logger.debug("Error extracting price per sqft: %s", e)
 
         return 'N/A'
 
-    def _extract_days_on_market(self, soup):
+    def _extract_days_on_market(self, page):
         """Extract days on market from page."""
         try:
+            # The C regex over the decoded page is far cheaper than walking the tree
+            match = _RE_DOM.search(page.text)
+            if match:
+                return f"{match.group(1)} days"
+
+            css_tree, tree = page.primary_tree
+            # Only walk the text nodes if the label appears in the page at all
+            if css_tree is not None and _RE_DOM_LABEL.search(page.text):
+                for node in css_tree.root.traverse(include_text=True):
+                    if node.tag == '-text' and _RE_DOM_LABEL.search(node.text_content or ''):
+                        days = _parse_days(node.parent.text(strip=True))
+                        if days:
+                            return days
+
+            if tree is not None:
+                for element in _XP_DOM(tree):
+                    days = _parse_days(_node_text(element))
+                    if days:
+                        return days
+
+            soup = page.soup
+
             # Look for "Time on Zillow" or "Days on Market"
-            keywords = ['Time on Zillow', 'Days on Zillow', 'on Zillow', 'Days on market']
-
-            for keyword in keywords:
-                elements = soup.find_all(string=lambda text: text and keyword.lower() in text.lower() if text else False)
-                for elem in elements:
-                    # Look for parent and nearby elements
-                    parent = elem.find_parent() if hasattr(elem, 'find_parent') else None
-                    if parent:
-                        # Get all text from parent
-                        full_text = parent.get_text(strip=True)
-                        # Extract number of days
-                        words = full_text.split()
-                        for i, word in enumerate(words):
-                            if word.isdigit() or (word.replace(',', '').isdigit()):
-                                # Check if next word is "day" or "days"
-                                if i + 1 < len(words) and 'day' in words[i + 1].lower():
-                                    return f"{word} days"
-                                # Or if it just has a number before "on Zillow"
-                                elif 'zillow' in full_text.lower() or 'market' in full_text.lower():
-                                    return f"{word} days"
+            for elem in soup.find_all(string=_RE_DOM_LABEL):
+                # Look for parent and nearby elements
+                parent = elem.find_parent() if hasattr(elem, 'find_parent') else None
+                if parent:
+                    # Get all text from parent and extract number of days
+                    days = _parse_days(parent.get_text(strip=True))
+                    if days:
+                        return days
 
         except Exception as e:
-            logger.debug(f"Error extracting days on market: {e}")
+            logger.debug("Error extracting days on market: %s", e)
 
         return 'N/A'
 
-    def scrape_urls(self, urls, output_file, append=False):
+    def scrape_urls(self, urls, output_file, append=False, rate=DEFAULT_RATE, burst=DEFAULT_BURST,
+                    progress='bar', quiet=False):
         """
         Scrape multiple URLs and save to CSV.
 
@@ -285,59 +920,67 @@ class ZillowScraper:
             urls: List of Zillow URLs to scrape
             output_file: Path to output CSV file
             append: Whether to append to existing file or create new
+            rate: Long-run average requests per second sent to Zillow
+            burst: Number of requests allowed back-to-back before throttling
+            progress: Per-URL progress style, one of PROGRESS_MODES
+            quiet: Only print the final summary
         """
+        if quiet:
+            progress = 'none'
+        elif progress == 'bar' and tqdm is None:
+            progress = 'log'
+
+        # Prepare output file
+        mode = 'a' if append and Path(output_file).exists() else 'w'
+
+        # Skip URLs that already have a successful row in the file being appended to
+        if mode == 'a':
+            scraped = read_scraped_urls(output_file)
+            remaining = [url for url in urls if url not in scraped]
+            skipped = len(urls) - len(remaining)
+            if skipped:
+                logger.info("Skipping %d URL(s) already in %s", skipped, output_file)
+            urls = remaining
+
+            if not urls:
+                print(f"\nAll URLs already scraped in {output_file}. Nothing to do.")
+                return
+
         # Warn if too many URLs
         if len(urls) > MAX_URLS_WARNING:
             print(f"\n⚠️  WARNING: You are attempting to scrape {len(urls)} URLs.")
             print(f"   Recommended maximum is {MAX_URLS_WARNING} URLs per execution.")
-            print(f"   This will take approximately {len(urls) * ((MIN_DELAY + MAX_DELAY) / 2) / 60:.1f} minutes.")
+            print(f"   This will take approximately {max(len(urls) - burst, 0) / rate / 60:.1f} minutes.")
             response = input("   Continue? (y/n): ")
             if response.lower() != 'y':
                 print("Aborted by user.")
                 sys.exit(0)
 
-        # Prepare output file
-        mode = 'a' if append and Path(output_file).exists() else 'w'
-        write_header = mode == 'w' or not Path(output_file).exists()
-
-        results = []
-        failed_count = 0
-
-        print(f"\nStarting scrape of {len(urls)} URL(s)...")
-        print(f"Output file: {output_file}")
-        print("-" * 60)
-
-        for i, url in enumerate(urls, 1):
-            print(f"\nProcessing {i}/{len(urls)}: {url[:60]}...")
-
-            # Scrape the URL
-            result = self.extract_property_data(url)
-            results.append(result)
-
-            if result['error']:
-                failed_count += 1
-                print(f"  ❌ Failed: {result['error']}")
-            else:
-                print(f"  ✓ Success: {result['address']}")
-                print(f"    Price: {result['price']} | Lot: {result['lot_size']}")
-
-            # Write to CSV incrementally
-            with open(output_file, mode, newline='', encoding='utf-8') as f:
-                fieldnames = ['url', 'address', 'lot_size', 'price', 'price_per_sqft',
-                            'days_on_market', 'scrape_timestamp', 'error']
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-
-                if write_header:
-                    writer.writeheader()
-                    write_header = False
-
-                writer.writerow(result)
-
-            # Rate limiting: sleep between requests (except for last one)
-            if i < len(urls):
-                delay = random.uniform(MIN_DELAY, MAX_DELAY)
-                print(f"  ⏱  Waiting {delay:.1f}s before next request...")
-                time.sleep(delay)
+        if not quiet:
+            print(f"\nStarting scrape of {len(urls)} URL(s)...")
+            print(f"Output file: {output_file}")
+            print("-" * 60)
+
+        # Open the CSV once for the whole batch; rows are buffered and flushed
+        # every CSV_FLUSH_EVERY rows, so at most that many are lost on a crash
+        with open(output_file, mode, buffering=CSV_BUFFER_SIZE, newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            if mode == 'w':
+                writer.writerow(CSV_FIELDNAMES)
+
+            try:
+                # Route console log lines through tqdm so they don't break the bar
+                redirect = logging_redirect_tqdm() if progress == 'bar' else contextlib.nullcontext()
+                with redirect:
+                    results = asyncio.run(self._scrape_batch(urls, f, writer, rate, burst, progress))
+            finally:
+                f.flush()
+                try:
+                    os.fsync(f.fileno())
+                except OSError as e:
+                    # Pipes and character devices such as /dev/stdout can't be synced
+                    logger.debug("Could not fsync %s: %s", output_file, e)
+        failed_count = sum(1 for result in results if result['error'])
 
         # Print summary
         print("\n" + "=" * 60)
@@ -352,21 +995,87 @@ class ZillowScraper:
             print(f"Error details logged to: scraper_errors.log")
         print("=" * 60)
 
+    async def _scrape_batch(self, urls, f, writer, rate, burst, progress):
+        """
+        Scrape URLs concurrently, writing rows to CSV in input order.
+
+        A result that finishes before an earlier URL's is held back until
+        every row ahead of it has been written.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        # Every URL targets zillow.com, so a single bucket covers the whole batch
+        bucket = TokenBucket(rate, burst)
+        bar = tqdm(total=len(urls), unit='url') if progress == 'bar' else None
+        completed = 0
+        pending = {}
+        next_row = 1
+
+        async def scrape(i, url):
+            nonlocal completed, next_row
+
+            async with semaphore:
+                result = await self.extract_property_data(session, url, limiter=bucket)
+
+            if result['error']:
+                logger.debug("Failed (%d/%d): %s", i, len(urls), result['error'])
+            else:
+                logger.debug("Success (%d/%d): %s | Price: %s | Lot: %s",
+                             i, len(urls), result['address'], result['price'], result['lot_size'])
+
+            # Write to CSV incrementally, releasing any rows this one was holding back
+            pending[i] = result
+            while next_row in pending:
+                writer.writerow(csv_row(pending.pop(next_row)))
+                if next_row % CSV_FLUSH_EVERY == 0:
+                    f.flush()
+                next_row += 1
+
+            completed += 1
+
+            if bar is not None:
+                bar.update(1)
+            elif progress == 'log':
+                logger.info("Completed %d/%d: %s - %s", completed, len(urls), url,
+                            result['error'] or 'OK')
+
+            return result
+
+        try:
+            async with self.create_session() as session:
+                # Only warm up if some URL will actually hit the network
+                if any(validate_url(url) and not (self.cache and self.cache.has(url)) for url in urls):
+                    await self.warm_up(session, limiter=bucket)
+                return await asyncio.gather(*(scrape(i, url) for i, url in enumerate(urls, 1)))
+        finally:
+            if bar is not None:
+                bar.close()
+
 
 def read_urls_from_file(file_path):
     """Read URLs from a text file (one per line)."""
     try:
         with open(file_path, 'r') as f:
             urls = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
-        return urls
+        # Drop duplicates while preserving order
+        return list(dict.fromkeys(urls))
     except FileNotFoundError:
-        logger.error(f"File not found: {file_path}")
+        logger.error("File not found: %s", file_path)
         sys.exit(1)
     except Exception as e:
-        logger.error(f"Error reading file: {e}")
+        logger.error("Error reading file: %s", e)
         sys.exit(1)
 
 
+def read_scraped_urls(csv_path):
+    """Return the set of URLs already scraped successfully in an output CSV."""
+    try:
+        with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+            return {row['url'] for row in csv.DictReader(f) if row.get('url') and not row.get('error')}
+    except (OSError, csv.Error, KeyError) as e:
+        logger.warning("Could not read existing results from %s: %s", csv_path, e)
+        return set()
+
+
 def main():
     """Main entry point for the scraper."""
     parser = argparse.ArgumentParser(
@@ -398,8 +1107,27 @@ Examples:
     parser.add_argument('--append', '-a', action='store_true',
                        help='Append to existing output file instead of creating new')
 
+    # Rate limiting options
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE,
+                       help=f'Average requests per second (default: {DEFAULT_RATE})')
+    parser.add_argument('--burst', type=int, default=DEFAULT_BURST,
+                       help=f'Requests allowed back-to-back before throttling (default: {DEFAULT_BURST})')
+
+    # Output verbosity options
+    parser.add_argument('--progress', choices=PROGRESS_MODES, default='bar',
+                       help='How to report per-URL progress (default: bar)')
+    parser.add_argument('--quiet', '-q', action='store_true',
+                       help='Only print the final summary')
+
+    # Caching options
+    parser.add_argument('--cache-dir',
+                       help='Cache fetched pages in this directory so re-runs skip the network (default: off)')
+
     args = parser.parse_args()
 
+    if args.rate <= 0 or args.burst < 1:
+        parser.error('--rate must be positive and --burst must be at least 1')
+
     # Gather URLs
     if args.url:
         urls = [args.url]
@@ -418,8 +1146,9 @@ Examples:
         output_file = f'zillow_data_{timestamp}.csv'
 
     # Run scraper
-    scraper = ZillowScraper()
-    scraper.scrape_urls(urls, output_file, append=args.append)
+    scraper = ZillowScraper(cache_dir=args.cache_dir)
+    scraper.scrape_urls(urls, output_file, append=args.append, rate=args.rate, burst=args.burst,
+                        progress=args.progress, quiet=args.quiet)
 
 
 if __name__ == '__main__':